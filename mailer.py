@@ -43,20 +43,21 @@ class Mailer:
             log.add_header("Content-Disposition", f"attachment; filename= {filename}")
             msg.attach(log)
 
-    def _message(self):
+    def _message(self, attach_log):
         """Construct email message."""
         msg = MIMEMultipart()
         msg["Subject"] = self._subject_line()
         msg["From"] = self.user
         msg["To"] = self.to_email
         msg.attach(MIMEText(self._body_text(), "plain"))
-        self._attachments(msg)
+        if attach_log:
+            self._attachments(msg)
         return msg.as_string()
 
-    def notify(self, error_message=None):
+    def notify(self, error_message=None, attach_log=True):
         """Send email success/error notifications."""
         self.error_message = error_message
         with self.server as s:
             s.login(self.user, self.password)
-            msg = self._message()
+            msg = self._message(attach_log)
             s.sendmail(self.user, self.to_email, msg)
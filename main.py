@@ -1,18 +1,28 @@
 import logging
+import logging.handlers
+import math
 import os
+import signal
 import sys
 import traceback
 import whetstone
 from sqlsorcery import MSSQL
 from mailer import Mailer
+from scheduler import Scheduler
 
 
-def configure_logging():
+def configure_logging(rotate=False):
+    filename = "data/app.log"
+    if rotate:
+        # Keep the log (and the copy attached to error emails) bounded when
+        # the process stays up between runs.
+        file_handler = logging.handlers.RotatingFileHandler(
+            filename, maxBytes=5 * 1024 * 1024, backupCount=3
+        )
+    else:
+        file_handler = logging.FileHandler(filename=filename, mode="w+")
     logging.basicConfig(
-        handlers=[
-            logging.FileHandler(filename="data/app.log", mode="w+"),
-            logging.StreamHandler(sys.stdout),
-        ],
+        handlers=[file_handler, logging.StreamHandler(sys.stdout)],
         level=logging.DEBUG,
         format="%(asctime)s | %(levelname)s: %(message)s",
         datefmt="%Y-%m-%d %I:%M:%S%p %Z",
@@ -21,51 +31,155 @@ def configure_logging():
     logging.getLogger("urllib3").setLevel(logging.ERROR)
 
 
+ENDPOINTS = [
+    whetstone.Users,
+    whetstone.Schools,
+    whetstone.Meetings,
+    whetstone.Observations,
+    whetstone.Measurements,
+    whetstone.Assignments,
+    whetstone.Informals,
+    whetstone.Rubrics,
+]
+
+TAGS = [
+    "courses",
+    "tags",
+    "grades",
+    "measurement_groups",
+    "goal_types",
+    "meeting_types",
+    "observation_types",
+    "assignment_types",
+    "assignment_presets",
+    "user_types",
+    "measurement_types",
+    "meeting_modules",
+    "meeting_standards",
+    "observation_labels",
+    "observation_modules",
+    "observation_types",
+    "periods",
+    "tracks",
+    "plu_content_areas",
+    "plu_event_types",
+]
+
+# Default refresh intervals in minutes, overridden by <NAME>_INTERVAL env vars.
+INTERVALS = {
+    "Users": 60,
+    "Schools": 1440,
+    "Meetings": 60,
+    "Observations": 15,
+    "Measurements": 1440,
+    "Assignments": 60,
+    "Informals": 60,
+    "Rubrics": 1440,
+    "Tags": 1440,
+}
+
+
+def load_tags(sql):
+    for tag in TAGS:
+        whetstone.Tag(sql, tag).transform_and_load()
+
+
+def jobs(sql):
+    """Returns (name, callable) pairs for each independently refreshed job."""
+    endpoint_jobs = [
+        (endpoint.__name__, lambda e=endpoint: e(sql).transform_and_load())
+        for endpoint in ENDPOINTS
+    ]
+    return endpoint_jobs + [("Tags", lambda: load_tags(sql))]
+
+
+def numeric_setting(variable, default, allow_zero=False):
+    """
+    Returns a numeric env setting, raising if it is not finite, negative or (unless
+    allowed) zero. Returns None if the variable is unset and the default is None.
+    """
+    value = os.getenv(variable, default=default)
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except ValueError:
+        raise ValueError(f"{variable} must be a number, got {value!r}")
+    if not math.isfinite(value):
+        raise ValueError(f"{variable} must be a finite number, got {value}")
+    if value < 0 or (value == 0 and not allow_zero):
+        bound = "0 or greater" if allow_zero else "greater than 0"
+        raise ValueError(f"{variable} must be {bound}, got {value}")
+    return value
+
+
+def interval(name):
+    """Returns the refresh interval in minutes for the named job."""
+    return numeric_setting(f"{name.upper()}_INTERVAL", INTERVALS[name])
+
+
+def notify_error(name, error_message):
+    """Emails the traceback of a scheduled job that started failing."""
+    if int(os.getenv("ENABLE_MAILER", default=0)):
+        Mailer(f"Whetstone Connector ({name})").notify(
+            error_message=error_message, attach_log=False
+        )
+
+
+def notify_recover(name):
+    """Emails that a previously failing scheduled job succeeded again."""
+    if int(os.getenv("ENABLE_MAILER", default=0)):
+        Mailer(f"Whetstone Connector ({name})").notify(attach_log=False)
+
+
 def main():
     configure_logging()
+    whetstone.Whetstone.timeout = numeric_setting("REQUEST_TIMEOUT", None)
     sql = MSSQL()
-    whetstone.Users(sql).transform_and_load()
-    whetstone.Schools(sql).transform_and_load()
-    whetstone.Meetings(sql).transform_and_load()
-    whetstone.Observations(sql).transform_and_load()
-    whetstone.Measurements(sql).transform_and_load()
-    whetstone.Assignments(sql).transform_and_load()
-    whetstone.Informals(sql).transform_and_load()
-    whetstone.Rubrics(sql).transform_and_load()
-
-    tags = [
-        "courses",
-        "tags",
-        "grades",
-        "measurement_groups",
-        "goal_types",
-        "meeting_types",
-        "observation_types",
-        "assignment_types",
-        "assignment_presets",
-        "user_types",
-        "measurement_types",
-        "meeting_modules",
-        "meeting_standards",
-        "observation_labels",
-        "observation_modules",
-        "observation_types",
-        "periods",
-        "tracks",
-        "plu_content_areas",
-        "plu_event_types",
-    ]
+    for _, job in jobs(sql):
+        job()
 
-    for tag in tags:
-        whetstone.Tag(sql, tag).transform_and_load()
 
+def build_scheduler():
+    """Validates the scheduler settings and registers each job."""
+    jitter = numeric_setting("SCHEDULER_JITTER", 60, allow_zero=True)
+    retry = numeric_setting("SCHEDULER_RETRY", 300)
+    intervals = {name: interval(name) for name in INTERVALS}
+    whetstone.Whetstone.timeout = numeric_setting("REQUEST_TIMEOUT", 60)
+    sql = MSSQL()
+    scheduler = Scheduler(
+        jitter=jitter, retry=retry, on_error=notify_error, on_recover=notify_recover
+    )
+    for name, job in jobs(sql):
+        scheduler.add_job(name, job, intervals[name])
+    return scheduler
 
-if __name__ == "__main__":
+
+def run_scheduler():
+    configure_logging(rotate=True)
     try:
-        main()
-        error_message = None
+        scheduler = build_scheduler()
     except Exception as e:
         logging.exception(e)
-        error_message = traceback.format_exc()
-    if int(os.getenv("ENABLE_MAILER", default=0)):
-        Mailer("Whetstone Connector").notify(error_message=error_message)
+        if int(os.getenv("ENABLE_MAILER", default=0)):
+            Mailer("Whetstone Connector").notify(
+                error_message=traceback.format_exc(), attach_log=False
+            )
+        sys.exit(1)
+    signal.signal(signal.SIGTERM, scheduler.stop)
+    signal.signal(signal.SIGINT, scheduler.stop)
+    scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    if int(os.getenv("ENABLE_SCHEDULER", default=0)):
+        run_scheduler()
+    else:
+        try:
+            main()
+            error_message = None
+        except Exception as e:
+            logging.exception(e)
+            error_message = traceback.format_exc()
+        if int(os.getenv("ENABLE_MAILER", default=0)):
+            Mailer("Whetstone Connector").notify(error_message=error_message)
@@ -0,0 +1,105 @@
+import logging
+import random
+import threading
+import time
+import traceback
+
+
+class Job:
+    """
+    A unit of work run by the scheduler on a fixed interval.
+
+    Params:
+        name:       The name of the job to be referenced in the logs.
+        func:       A callable that performs one refresh of the job.
+        interval:   Minutes to wait between the end of one run and the next.
+    """
+
+    def __init__(self, name, func, interval):
+        self.name = name
+        self.func = func
+        self.interval = interval * 60
+        self.next_run = time.monotonic()
+        self.failing = False
+
+
+class Scheduler:
+    """
+    Runs jobs in a single long-lived process so HTTP and DB connections stay
+    warm between cycles. Jobs run one at a time, so a slow job delays the
+    others instead of overlapping with them, and missed runs are not queued up.
+
+    Params:
+        jitter:     (Optional) Maximum seconds of random delay added to each run.
+        retry:      (Optional) Seconds to wait before rerunning a failed job, if
+                    shorter than its interval.
+        on_error:   (Optional) Callable receiving the job name and formatted
+                    traceback when a job that was working starts to raise.
+        on_recover: (Optional) Callable receiving the job name when a failing
+                    job succeeds again.
+    """
+
+    def __init__(self, jitter=0, retry=300, on_error=None, on_recover=None):
+        self.jobs = []
+        self.jitter = jitter
+        self.retry = retry
+        self.on_error = on_error
+        self.on_recover = on_recover
+        self.stopping = threading.Event()
+
+    def add_job(self, name, func, interval):
+        """Register a callable to be run every `interval` minutes."""
+        self.jobs.append(Job(name, func, interval))
+
+    def _run_job(self, job):
+        """Run a job, logging failures rather than stopping the scheduler."""
+        logging.info(f"{job.name}: starting scheduled run.")
+        start = time.monotonic()
+        wait = job.interval
+        try:
+            job.func()
+            if job.failing:
+                job.failing = False
+                self._call_hook(job, self.on_recover, job.name)
+        except Exception as e:
+            logging.exception(e)
+            wait = min(job.interval, self.retry)
+            if not job.failing:
+                job.failing = True
+                self._call_hook(job, self.on_error, job.name, traceback.format_exc())
+        finally:
+            finished = time.monotonic()
+            logging.info(f"{job.name}: finished in {finished - start:.1f}s.")
+            job.next_run = finished + wait + random.uniform(0, self.jitter)
+
+    def _call_hook(self, job, hook, *args):
+        """Call a notification hook without letting it stop the scheduler."""
+        if hook:
+            try:
+                hook(*args)
+            except Exception as e:
+                logging.error(f"{job.name}: notification failed.")
+                logging.exception(e)
+
+    def run_pending(self):
+        """Run every job that is due, then return seconds until the next one."""
+        for job in sorted(self.jobs, key=lambda job: job.next_run):
+            if self.stopping.is_set():
+                break
+            if job.next_run <= time.monotonic():
+                self._run_job(job)
+        next_run = min(job.next_run for job in self.jobs)
+        return max(next_run - time.monotonic(), 0)
+
+    def stop(self, *args):
+        """
+        Ask the scheduler to exit once the current job finishes. Accepts and ignores
+        the arguments passed to signal handlers so it can be registered directly.
+        """
+        logging.info("Stopping scheduler after the current job.")
+        self.stopping.set()
+
+    def run_forever(self):
+        """Loop over the registered jobs until stop() is called."""
+        while not self.stopping.is_set():
+            self.stopping.wait(self.run_pending())
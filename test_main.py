@@ -0,0 +1,47 @@
+import sys
+import types
+
+import pytest
+
+# sqlsorcery needs the MSSQL ODBC driver to import; these tests never connect.
+sys.modules.setdefault("sqlsorcery", types.SimpleNamespace(MSSQL=None))
+
+import main  # noqa: E402
+
+
+def test_numeric_setting_uses_default_when_unset(monkeypatch):
+    monkeypatch.delenv("TEST_SETTING", raising=False)
+    assert main.numeric_setting("TEST_SETTING", 15) == 15
+    assert main.numeric_setting("TEST_SETTING", None) is None
+
+
+def test_numeric_setting_reads_environment(monkeypatch):
+    monkeypatch.setenv("TEST_SETTING", "1.5")
+    assert main.numeric_setting("TEST_SETTING", 15) == 1.5
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "nan", "inf", "-inf", "soon"])
+def test_numeric_setting_rejects_invalid_values(monkeypatch, value):
+    monkeypatch.setenv("TEST_SETTING", value)
+    with pytest.raises(ValueError, match="TEST_SETTING"):
+        main.numeric_setting("TEST_SETTING", 15)
+
+
+def test_numeric_setting_allows_zero_when_requested(monkeypatch):
+    monkeypatch.setenv("TEST_SETTING", "0")
+    assert main.numeric_setting("TEST_SETTING", 15, allow_zero=True) == 0
+    monkeypatch.setenv("TEST_SETTING", "-1")
+    with pytest.raises(ValueError):
+        main.numeric_setting("TEST_SETTING", 15, allow_zero=True)
+
+
+def test_interval_reads_override_by_job_name(monkeypatch):
+    monkeypatch.setenv("OBSERVATIONS_INTERVAL", "5")
+    assert main.interval("Observations") == 5
+    monkeypatch.delenv("OBSERVATIONS_INTERVAL")
+    assert main.interval("Observations") == main.INTERVALS["Observations"]
+
+
+def test_every_job_has_an_interval():
+    names = [name for name, _ in main.jobs(sql=None)]
+    assert sorted(names) == sorted(main.INTERVALS)
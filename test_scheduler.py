@@ -0,0 +1,140 @@
+import pytest
+import scheduler
+
+
+class Clock:
+    """A stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scheduler.time, "monotonic", clock)
+    return clock
+
+
+def fail():
+    raise RuntimeError("job failed")
+
+
+def test_failing_job_does_not_stop_other_jobs(clock):
+    runs = []
+    errors = []
+    s = scheduler.Scheduler(on_error=lambda name, message: errors.append(name))
+    s.add_job("broken", fail, 10)
+    s.add_job("working", lambda: runs.append("working"), 10)
+    s.run_pending()
+    assert runs == ["working"]
+    assert errors == ["broken"]
+
+
+def test_error_hook_receives_formatted_traceback(clock):
+    messages = []
+    s = scheduler.Scheduler(on_error=lambda name, message: messages.append(message))
+    s.add_job("broken", fail, 10)
+    s.run_pending()
+    assert "Traceback" in messages[0]
+    assert "RuntimeError: job failed" in messages[0]
+
+
+def test_error_hook_only_called_when_job_starts_failing(clock):
+    outcomes = [fail, fail, lambda: None, fail]
+    events = []
+    s = scheduler.Scheduler(
+        retry=60,
+        on_error=lambda name, message: events.append("error"),
+        on_recover=lambda name: events.append("recover"),
+    )
+    s.add_job("flaky", lambda: outcomes.pop(0)(), 1)
+    for _ in range(4):
+        s.run_pending()
+        clock.now += 60
+    assert events == ["error", "recover", "error"]
+
+
+def test_failing_error_hook_does_not_stop_scheduler(clock):
+    runs = []
+
+    def on_error(name, message):
+        raise OSError("smtp unavailable")
+
+    s = scheduler.Scheduler(on_error=on_error)
+    s.add_job("broken", fail, 10)
+    s.add_job("working", lambda: runs.append("working"), 10)
+    s.run_pending()
+    assert runs == ["working"]
+    assert [job.next_run for job in s.jobs] == [1300, 1600]
+
+
+def test_failed_job_retries_sooner_than_interval(clock):
+    s = scheduler.Scheduler(retry=300)
+    s.add_job("daily", fail, 1440)
+    s.add_job("frequent", fail, 1)
+    s.run_pending()
+    assert [job.next_run for job in s.jobs] == [1300, 1060]
+
+
+def test_job_returns_to_interval_after_recovering(clock):
+    attempts = []
+
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            fail()
+
+    s = scheduler.Scheduler(retry=300)
+    s.add_job("daily", flaky, 1440)
+    assert s.run_pending() == 300
+    clock.now += 300
+    s.run_pending()
+    assert attempts == [1000, 1300]
+    assert s.jobs[0].next_run == 1300 + 1440 * 60
+
+
+def test_next_run_includes_interval_and_jitter(clock, monkeypatch):
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+
+    def slow_job():
+        clock.now += 30
+
+    s = scheduler.Scheduler(jitter=45)
+    s.add_job("slow", slow_job, 15)
+    s.run_pending()
+    assert s.jobs[0].next_run == 1000 + 30 + 15 * 60 + 45
+
+
+def test_run_pending_returns_time_until_next_job(clock):
+    runs = []
+    s = scheduler.Scheduler()
+    s.add_job("often", lambda: runs.append("often"), 1)
+    s.add_job("rarely", lambda: runs.append("rarely"), 60)
+    assert s.run_pending() == 60
+    assert runs == ["often", "rarely"]
+
+    clock.now += 20
+    assert s.run_pending() == 40
+    assert runs == ["often", "rarely"]
+
+    clock.now += 40
+    assert s.run_pending() == 60
+    assert runs == ["often", "rarely", "often"]
+
+
+def test_stop_skips_remaining_jobs_and_ends_loop(clock):
+    runs = []
+    s = scheduler.Scheduler()
+
+    def first():
+        runs.append("first")
+        s.stop()
+
+    s.add_job("first", first, 10)
+    s.add_job("second", lambda: runs.append("second"), 10)
+    s.run_forever()
+    assert runs == ["first"]
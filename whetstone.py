@@ -5,6 +5,10 @@ import requests
 import base64
 import pandas as pd
 
+# Shared across endpoint instances so connections are reused between requests
+# and, when running under the scheduler, between refresh cycles.
+session = requests.Session()
+
 
 class CredentialError(Exception):
     def __init__(self):
@@ -25,6 +29,9 @@ class Whetstone:
         An instance of the endpoint that can be called to make a request.
     """
 
+    # Seconds to wait on the API before giving up; None waits indefinitely.
+    timeout = None
+
     def __init__(self, sql, qa=False):
         subdomain = "api-qa" if qa else "api"
         self.url = f"https://{subdomain}.whetstoneeducation.com"
@@ -51,7 +58,7 @@ class Whetstone:
         """Returns a client token to authorize requests."""
         auth_url = f"{self.url}/auth/client/token"
         headers = {"Authorization": self._encode_credentials()}
-        response = requests.post(auth_url, headers=headers)
+        response = session.post(auth_url, headers=headers, timeout=self.timeout)
 
         if response.status_code == 200:
             response_json = response.json()
@@ -77,12 +84,12 @@ class Whetstone:
         else:
             endpoint_url = f"{self.url}/external/{self.endpoint}"
         headers = {"Authorization": f"Bearer {self.token}"}
-        response = requests.get(endpoint_url, headers=headers)
+        response = session.get(endpoint_url, headers=headers, timeout=self.timeout)
         if response.status_code == 200:
             total = response.json()["count"]
             while skip < total:
                 page_url = f"{endpoint_url}?skip={skip}"
-                response = requests.get(page_url, headers=headers)
+                response = session.get(page_url, headers=headers, timeout=self.timeout)
                 results = response.json()["data"]
                 records.extend(results)
                 skip += 100